@@ -7,20 +7,29 @@ import argparse
 import json
 import os
 import re
+import selectors
+import shutil
 import signal
 import socket
-import socketserver
 import subprocess
 import sys
 import threading
-import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Both parsers take smartctl's stdout as bytes, so it is never decoded to str first.
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional speedup
+    _json = json  # type: ignore[assignment]
+_loads = _json.loads
 
 VERSION = "v0.0.1"
 DEFAULT_PORT = 7634
 DEFAULT_SEPARATOR = "|"
 DEFAULT_MIN_INTERVAL = 60
+LISTEN_BACKLOG = 128
 
 TYPE_TO_SMARTCTL = {
     "SATA": "sat",
@@ -30,16 +39,60 @@ TYPE_TO_SMARTCTL = {
     "NVME": "nvme",
 }
 
+# Identity (model name) and attributes (temperature) are all we read. Each extra log
+# is another round of slow pass-through commands to the drive.
+SMARTCTL_QUERY_ARGS = ("-i", "-A", "-j")
+SMARTCTL_FULL_ARGS = ("-a", "-j")
+
+# Status values the daemon protocol reports as-is; anything else is sent as ERR.
+DAEMON_STATUS_FIELDS = {
+    "NA": "NA",
+    "UNK": "UNK",
+    "NOS": "NOS",
+    "SLP": "SLP",
+    "ERR": "ERR",
+}
+
+_INT_RE = re.compile(r"-?\d+")
+
+# Lowercased smartctl message fragments and the status they imply. Matched in one
+# pass; infer_status_from_messages() applies the SLP > ERR > NA priority.
+_STATUS_BY_MESSAGE = {
+    "standby": "SLP",
+    "sleep": "SLP",
+    "permission denied": "ERR",
+    "unable to open device": "ERR",
+    "no such device": "ERR",
+    "cannot open": "ERR",
+    "smart support is: unavailable": "NA",
+    "unknown usb bridge": "NA",
+}
+_STATUS_RE = re.compile("|".join(re.escape(message) for message in _STATUS_BY_MESSAGE))
+
+# smartctl spends its time waiting on the drive, so polls overlap well in threads
+# regardless of CPU count.
+_POLL_POOL = ThreadPoolExecutor(max_workers=8)
 
-@dataclass
+_SMARTCTL_PATH: Optional[str] = None
+
+
+@dataclass(frozen=True)
 class DeviceSpec:
     raw: str
     drive: str
     smartctl_type: Optional[str]
+    full_report: bool = False
+    # smartctl argv up to (not including) the standby flag and drive, built once per device.
+    argv_base: Tuple[str, ...] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        argv = ("smartctl",) + (SMARTCTL_FULL_ARGS if self.full_report else SMARTCTL_QUERY_ARGS)
+        if self.smartctl_type:
+            argv += ("-d", self.smartctl_type)
+        object.__setattr__(self, "argv_base", argv)
 
-@dataclass
-class DiskReading:
+
+class DiskReading(NamedTuple):
     drive: str
     model: str
     status: str  # KNOWN | NOS | UNK | NA | SLP | ERR
@@ -47,15 +100,15 @@ class DiskReading:
     detail: str = ""
 
 
-def parse_device_spec(raw: str) -> DeviceSpec:
+def parse_device_spec(raw: str, full_report: bool = False) -> DeviceSpec:
     if ":" not in raw:
-        return DeviceSpec(raw=raw, drive=raw, smartctl_type=None)
+        return DeviceSpec(raw=raw, drive=raw, smartctl_type=None, full_report=full_report)
 
     prefix, drive = raw.split(":", 1)
     smartctl_type = TYPE_TO_SMARTCTL.get(prefix.upper())
     if smartctl_type and drive:
-        return DeviceSpec(raw=raw, drive=drive, smartctl_type=smartctl_type)
-    return DeviceSpec(raw=raw, drive=raw, smartctl_type=None)
+        return DeviceSpec(raw=raw, drive=drive, smartctl_type=smartctl_type, full_report=full_report)
+    return DeviceSpec(raw=raw, drive=raw, smartctl_type=None, full_report=full_report)
 
 
 def parse_int(value: Any) -> Optional[int]:
@@ -64,16 +117,22 @@ def parse_int(value: Any) -> Optional[int]:
     if isinstance(value, float):
         return int(value)
     if isinstance(value, str):
-        match = re.search(r"-?\d+", value)
+        if value.isdecimal():
+            return int(value)
+        match = _INT_RE.search(value)
         if match:
             return int(match.group(0))
     return None
 
 
 def normalize_temp_c(value: Any) -> Optional[int]:
-    parsed = parse_int(value)
-    if parsed is None:
-        return None
+    # smartctl JSON almost always carries temperatures as ints; skip parse_int() for those.
+    if isinstance(value, int):
+        parsed = value
+    else:
+        parsed = parse_int(value)
+        if parsed is None:
+            return None
     # Some NVMe reports can be in Kelvin.
     if parsed > 200:
         parsed = parsed - 273
@@ -82,32 +141,29 @@ def normalize_temp_c(value: Any) -> Optional[int]:
     return parsed
 
 
-def first_non_empty_string(candidates: Sequence[Any]) -> Optional[str]:
-    for candidate in candidates:
-        if isinstance(candidate, str):
-            stripped = candidate.strip()
-            if stripped:
-                return stripped
+def non_empty_string(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped:
+            return stripped
     return None
 
 
 def extract_model(data: Dict[str, Any], drive: str) -> str:
-    device_info = data.get("device", {})
+    device_info = data.get("device")
     if not isinstance(device_info, dict):
         device_info = {}
 
-    model = first_non_empty_string(
-        [
-            data.get("model_name"),
-            data.get("nvme_model_name"),
-            data.get("scsi_model_name"),
-            data.get("product"),
-            device_info.get("model_name"),
-            device_info.get("name"),
-            drive,
-        ]
+    return (
+        non_empty_string(data.get("model_name"))
+        or non_empty_string(data.get("nvme_model_name"))
+        or non_empty_string(data.get("scsi_model_name"))
+        or non_empty_string(data.get("product"))
+        or non_empty_string(device_info.get("model_name"))
+        or non_empty_string(device_info.get("name"))
+        or non_empty_string(drive)
+        or drive
     )
-    return model or drive
 
 
 def extract_temperature_c(data: Dict[str, Any]) -> Optional[int]:
@@ -133,12 +189,16 @@ def extract_temperature_c(data: Dict[str, Any]) -> Optional[int]:
     if isinstance(ata_attrs, dict):
         table = ata_attrs.get("table")
         if isinstance(table, list):
+            # Rows sharing an id are kept in table order, so a row without a usable
+            # value falls through to the next one, as a per-id scan of the table would.
+            rows_by_id: Dict[Any, List[Dict[str, Any]]] = {}
+            for row in table:
+                if isinstance(row, dict):
+                    attr_id = row.get("id")
+                    if isinstance(attr_id, (int, float)):
+                        rows_by_id.setdefault(attr_id, []).append(row)
             for attr_id in (194, 190, 231):
-                for row in table:
-                    if not isinstance(row, dict):
-                        continue
-                    if row.get("id") != attr_id:
-                        continue
+                for row in rows_by_id.get(attr_id, ()):
                     raw = row.get("raw", {})
                     if isinstance(raw, dict):
                         parsed = normalize_temp_c(raw.get("value"))
@@ -151,7 +211,7 @@ def extract_temperature_c(data: Dict[str, Any]) -> Optional[int]:
     return None
 
 
-def gather_messages(data: Dict[str, Any], stderr: str) -> str:
+def gather_messages(data: Dict[str, Any], stderr: bytes) -> str:
     messages: List[str] = []
     smartctl = data.get("smartctl")
     if isinstance(smartctl, dict):
@@ -164,44 +224,46 @@ def gather_messages(data: Dict[str, Any], stderr: str) -> str:
                 if isinstance(value, str):
                     messages.append(value)
     if stderr:
-        messages.append(stderr)
+        # stderr is usually empty, so it is only decoded when there is something to report.
+        messages.append(stderr.decode("utf-8", errors="replace"))
     return "\n".join(messages)
 
 
 def infer_status_from_messages(messages: str, has_temp: bool) -> str:
-    lowered = messages.lower()
-    if "standby" in lowered or "sleep" in lowered:
-        return "SLP"
-    if "permission denied" in lowered or "unable to open device" in lowered:
-        return "ERR"
-    if "no such device" in lowered or "cannot open" in lowered:
-        return "ERR"
-    if "smart support is: unavailable" in lowered:
-        return "NA"
-    if "unknown usb bridge" in lowered:
-        return "NA"
+    # Healthy drives usually report no messages at all; skip lowercasing and scanning.
+    if messages:
+        found = {_STATUS_BY_MESSAGE[match] for match in _STATUS_RE.findall(messages.lower())}
+        for status in ("SLP", "ERR", "NA"):
+            if status in found:
+                return status
     if has_temp:
         return "KNOWN"
-    if "temperature" in lowered and "not" in lowered:
-        return "NOS"
     return "NOS"
 
 
+def smartctl_executable() -> str:
+    global _SMARTCTL_PATH
+    # Resolved once; a miss is retried so installing smartmontools later is picked up.
+    if _SMARTCTL_PATH is None:
+        _SMARTCTL_PATH = shutil.which("smartctl")
+    return _SMARTCTL_PATH or "smartctl"
+
+
 def run_smartctl(spec: DeviceSpec, wake_up: bool, timeout: int = 10) -> DiskReading:
-    cmd: List[str] = ["smartctl", "-a", "-j"]
-    if spec.smartctl_type:
-        cmd.extend(["-d", spec.smartctl_type])
+    cmd = list(spec.argv_base)
     if not wake_up:
-        cmd.extend(["-n", "standby"])
+        cmd.extend(("-n", "standby"))
     cmd.append(spec.drive)
 
     try:
-        proc = subprocess.run(
+        # close_fds=False plus an absolute executable lets CPython use posix_spawn()
+        # instead of fork+exec. Descriptors opened by Python are non-inheritable anyway.
+        proc = subprocess.Popen(
             cmd,
-            check=False,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+            executable=smartctl_executable(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False,
         )
     except FileNotFoundError:
         return DiskReading(
@@ -210,22 +272,28 @@ def run_smartctl(spec: DeviceSpec, wake_up: bool, timeout: int = 10) -> DiskRead
             status="ERR",
             detail="smartctl not found (install smartmontools)",
         )
-    except subprocess.TimeoutExpired:
-        return DiskReading(
-            drive=spec.drive,
-            model=spec.drive,
-            status="ERR",
-            detail="smartctl timed out",
-        )
 
-    stdout = proc.stdout or ""
-    stderr = proc.stderr or ""
+    with proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Leaving the block closes the pipes and reaps the killed process.
+            proc.kill()
+            return DiskReading(
+                drive=spec.drive,
+                model=spec.drive,
+                status="ERR",
+                detail="smartctl timed out",
+            )
+
+    stdout = stdout or b""
+    stderr = stderr or b""
     parsed: Dict[str, Any] = {}
 
     try:
-        parsed = json.loads(stdout) if stdout.strip() else {}
-    except json.JSONDecodeError:
-        message = stderr.strip() or stdout.strip() or "invalid smartctl output"
+        parsed = _loads(stdout) if stdout.strip() else {}
+    except (_json.JSONDecodeError, ValueError):
+        message = (stderr.strip() or stdout.strip()).decode("utf-8", errors="replace") or "invalid smartctl output"
         return DiskReading(
             drive=spec.drive,
             model=spec.drive,
@@ -235,7 +303,7 @@ def run_smartctl(spec: DeviceSpec, wake_up: bool, timeout: int = 10) -> DiskRead
 
     model = extract_model(parsed, spec.drive)
     temperature_c = extract_temperature_c(parsed)
-    messages = gather_messages(parsed, stderr)
+    messages = gather_messages(parsed, stderr).strip()
     status = infer_status_from_messages(messages, has_temp=(temperature_c is not None))
 
     if temperature_c is not None:
@@ -244,20 +312,22 @@ def run_smartctl(spec: DeviceSpec, wake_up: bool, timeout: int = 10) -> DiskRead
             model=model,
             status="KNOWN",
             temperature_c=temperature_c,
-            detail=messages.strip(),
+            detail=messages,
         )
 
     return DiskReading(
         drive=spec.drive,
         model=model,
         status=status,
-        detail=messages.strip(),
+        detail=messages,
     )
 
 
 def convert_temperature(temp_c: int, unit: str) -> int:
     if unit == "F":
-        return int(round((temp_c * 9.0 / 5.0) + 32.0))
+        # 9C/5 is always a multiple of 0.2, never a .5 tie, so adding 2 before the
+        # floor division rounds to nearest exactly like round() did on the float.
+        return (temp_c * 9 + 162) // 5
     return temp_c
 
 
@@ -295,13 +365,7 @@ def format_daemon_payload(readings: Sequence[DiskReading], separator: str, unit:
             )
             continue
 
-        status_field = {
-            "NA": "NA",
-            "UNK": "UNK",
-            "NOS": "NOS",
-            "SLP": "SLP",
-            "ERR": "ERR",
-        }.get(reading.status, "ERR")
+        status_field = DAEMON_STATUS_FIELDS.get(reading.status, "ERR")
         items.append(
             f"{separator}{reading.drive}{separator}{reading.model}"
             f"{separator}{status_field}{separator}*{separator}"
@@ -311,50 +375,186 @@ def format_daemon_payload(readings: Sequence[DiskReading], separator: str, unit:
 
 
 class ReadingCache:
-    def __init__(self, devices: Sequence[DeviceSpec], wake_up: bool, min_interval: int):
+    def __init__(
+        self,
+        devices: Sequence[DeviceSpec],
+        wake_up: bool,
+        min_interval: int,
+    ) -> None:
         self.devices = list(devices)
         self.wake_up = wake_up
         self.min_interval = min_interval
         self.lock = threading.Lock()
-        self.last_update = 0.0
-        self.readings: List[DiskReading] = []
+        self.readings: Tuple[DiskReading, ...] = ()
+        self.next_index = 0
+        # Encoded daemon responses for the current readings, keyed by (separator, unit).
+        self.payloads: Dict[Tuple[str, str], memoryview] = {}
+
+    def poll(self, device: DeviceSpec) -> DiskReading:
+        # A failed launch (EACCES, EAGAIN, ENOMEM, ...) marks this drive ERR until the
+        # next poll instead of escaping into the refresh thread.
+        try:
+            return run_smartctl(device, wake_up=self.wake_up)
+        except Exception as exc:
+            return DiskReading(
+                drive=device.drive,
+                model=device.drive,
+                status="ERR",
+                detail=f"smartctl failed: {exc}",
+            )
 
-    def get(self) -> List[DiskReading]:
+    def refresh(self) -> None:
+        # smartctl accepts exactly one device per invocation (--scan-open only lists
+        # devices), so a full refresh is one process per drive, run concurrently.
+        readings = tuple(_POLL_POOL.map(self.poll, self.devices))
         with self.lock:
-            now = time.monotonic()
-            if not self.readings or (now - self.last_update) >= self.min_interval:
-                self.readings = [run_smartctl(device, wake_up=self.wake_up) for device in self.devices]
-                self.last_update = now
-            return list(self.readings)
-
-
-class HDDTempTCPHandler(socketserver.BaseRequestHandler):
-    def handle(self) -> None:
-        server: "HDDTempServer" = self.server  # type: ignore[assignment]
-        payload = format_daemon_payload(
-            readings=server.cache.get(),
-            separator=server.separator,
-            unit=server.unit,
-        )
-        self.request.sendall(payload.encode("utf-8"))
+            self.readings = readings
+            self.payloads = {}
+
+    def refresh_next(self) -> None:
+        # Poll a single drive, round-robin, so only one drive at a time sees SMART traffic.
+        index = self.next_index
+        self.next_index = (index + 1) % len(self.devices)
+        reading = self.poll(self.devices[index])
+        with self.lock:
+            self.readings = self.readings[:index] + (reading,) + self.readings[index + 1 :]
+            self.payloads = {}
 
+    def get(self) -> Tuple[DiskReading, ...]:
+        with self.lock:
+            return self.readings
+
+    def payload(self, separator: str, unit: str) -> memoryview:
+        # Formatted at most once per refresh for each framing; every other client
+        # gets the same read-only buffer.
+        key = (separator, unit)
+        with self.lock:
+            payload = self.payloads.get(key)
+            if payload is None:
+                payload = memoryview(format_daemon_payload(self.readings, separator, unit).encode("utf-8"))
+                self.payloads[key] = payload
+            return payload
 
-class HDDTempServer(socketserver.ThreadingTCPServer):
-    allow_reuse_address = True
-    daemon_threads = True
+
+class HDDTempServer:
+    """Single-threaded selectors loop: write the cached payload to each client, then close."""
 
     def __init__(
         self,
         server_address: Tuple[str, int],
-        handler_class: type,
         cache: ReadingCache,
-        separator: str,
-        unit: str,
+        separator: str = DEFAULT_SEPARATOR,
+        unit: str = "C",
+        family: int = socket.AF_INET,
+        reuse_port: bool = False,
     ) -> None:
         self.cache = cache
         self.separator = separator
         self.unit = unit
-        super().__init__(server_address, handler_class)
+        self.stop_event = threading.Event()
+        self.refresh_thread: Optional[threading.Thread] = None
+        self.selector = selectors.DefaultSelector()
+        self.socket = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Lets several daemon processes share one port; the kernel spreads connections.
+            if reuse_port:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.socket.bind(server_address)
+            self.socket.listen(LISTEN_BACKLOG)
+            self.socket.setblocking(False)
+        except OSError:
+            self.socket.close()
+            raise
+        self.server_address = self.socket.getsockname()
+        self.selector.register(self.socket, selectors.EVENT_READ)
+
+    def start_refresh(self) -> None:
+        # Block once so the first clients never see an empty payload; after that,
+        # clients only ever read the cache and smartctl runs in the background.
+        self.cache.refresh()
+        self.refresh_thread = threading.Thread(target=self.refresh_loop, name="hddtemp-refresh", daemon=True)
+        self.refresh_thread.start()
+
+    def refresh_loop(self) -> None:
+        # Spread the polls across min_interval: each drive is still refreshed once per
+        # interval, but the drives are never all busy with smartctl at the same moment.
+        interval = self.cache.min_interval / max(len(self.cache.devices), 1)
+        # start_refresh() just polled every drive, so the round-robin starts a full
+        # min_interval later; otherwise the first drives would be queried again early.
+        delay = self.cache.min_interval
+        while not self.stop_event.wait(delay):
+            delay = interval
+            # Keep the thread alive whatever happens; a dead refresher would leave the
+            # daemon serving the same readings forever.
+            try:
+                self.cache.refresh_next()
+            except Exception:
+                continue
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        while not self.stop_event.is_set():
+            for key, _events in self.selector.select(poll_interval):
+                if key.fileobj is self.socket:
+                    self.accept()
+                else:
+                    self.send_pending(key.fileobj, key.data, registered=True)  # type: ignore[arg-type]
+
+    def accept(self) -> None:
+        # Drain the backlog on each wakeup so a burst of clients costs one select() call.
+        payload_view = self.cache.payload(self.separator, self.unit)
+        for _ in range(LISTEN_BACKLOG):
+            try:
+                conn, _address = self.socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except ConnectionAbortedError:
+                continue
+            except OSError:
+                # EMFILE/ENFILE/ENOBUFS: leave the rest of the backlog queued and retry on
+                # the next wakeup rather than taking the whole daemon down.
+                return
+            conn.setblocking(False)
+            self.send_pending(conn, payload_view, registered=False)
+
+    def send_pending(self, conn: socket.socket, pending: memoryview, registered: bool) -> None:
+        try:
+            sent = conn.send(pending)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self.close_connection(conn, registered)
+            return
+
+        if sent < len(pending):
+            # Socket buffer is full; wait until it drains and send the rest.
+            if registered:
+                self.selector.modify(conn, selectors.EVENT_WRITE, pending[sent:])
+            else:
+                self.selector.register(conn, selectors.EVENT_WRITE, pending[sent:])
+            return
+
+        try:
+            conn.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+        self.close_connection(conn, registered)
+
+    def close_connection(self, conn: socket.socket, registered: bool) -> None:
+        if registered:
+            self.selector.unregister(conn)
+        conn.close()
+
+    def shutdown(self) -> None:
+        # Only sets a flag, so it is safe to call from a signal handler.
+        self.stop_event.set()
+
+    def server_close(self) -> None:
+        self.stop_event.set()
+        for key in list(self.selector.get_map().values()):
+            self.selector.unregister(key.fileobj)
+            key.fileobj.close()  # type: ignore[union-attr]
+        self.selector.close()
 
 
 def daemonize() -> None:
@@ -411,15 +611,13 @@ def run_daemon_mode(args: argparse.Namespace, devices: Sequence[DeviceSpec]) ->
         min_interval=args.min_interval,
     )
 
-    class BoundServer(HDDTempServer):
-        address_family = family
-
-    server = BoundServer(
+    server = HDDTempServer(
         server_address=(host, args.port),
-        handler_class=HDDTempTCPHandler,
         cache=cache,
         separator=args.separator,
         unit=args.unit,
+        family=family,
+        reuse_port=args.reuse_port,
     )
 
     if not args.foreground:
@@ -431,11 +629,15 @@ def run_daemon_mode(args: argparse.Namespace, devices: Sequence[DeviceSpec]) ->
         stop_requested["value"] = True
         server.shutdown()
 
+    # Installed before the startup poll, which can block for a smartctl timeout.
     for signum in (signal.SIGINT, signal.SIGTERM):
         signal.signal(signum, handle_stop)
 
     try:
-        server.serve_forever()
+        # Start polling only after daemonize(): threads do not survive the fork.
+        server.start_refresh()
+        if not stop_requested["value"]:
+            server.serve_forever()
     finally:
         server.server_close()
 
@@ -467,9 +669,19 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_MIN_INTERVAL,
         help="Minimum seconds between drive polls in daemon mode.",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Query drives with smartctl -a instead of -i -A (slower; for debugging).",
+    )
     parser.add_argument("-w", "--wake-up", action="store_true", help="Allow smartctl to wake sleeping drives.")
     parser.add_argument("-4", "--ipv4", action="store_true", help="Use IPv4 sockets.")
     parser.add_argument("-6", "--ipv6", action="store_true", help="Use IPv6 sockets.")
+    parser.add_argument(
+        "--reuse-port",
+        action="store_true",
+        help="Set SO_REUSEPORT so several daemon processes can share the listen port.",
+    )
     parser.add_argument("-v", "--version", action="version", version=f"hddtemp {VERSION}")
     return parser
 
@@ -488,8 +700,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         parser.error("choose either -4 or -6, not both")
     if args.foreground and not args.daemon:
         parser.error("--foreground requires --daemon")
+    if args.reuse_port and not args.daemon:
+        parser.error("--reuse-port requires --daemon")
+    if args.reuse_port and not hasattr(socket, "SO_REUSEPORT"):
+        parser.error("--reuse-port is not supported on this platform")
 
-    devices = [parse_device_spec(raw) for raw in args.drives]
+    devices = [parse_device_spec(raw, full_report=args.full) for raw in args.drives]
 
     if args.daemon:
         return run_daemon_mode(args, devices)
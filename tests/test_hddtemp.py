@@ -1,4 +1,14 @@
+import contextlib
+import errno
+import io
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 
 import hddtemp
 
@@ -8,6 +18,27 @@ class HDDTempTests(unittest.TestCase):
         spec = hddtemp.parse_device_spec("SATA:/dev/sda")
         self.assertEqual(spec.drive, "/dev/sda")
         self.assertEqual(spec.smartctl_type, "sat")
+        self.assertEqual(spec.argv_base, ("smartctl", "-i", "-A", "-j", "-d", "sat"))
+        full_spec = hddtemp.parse_device_spec("SATA:/dev/sda", full_report=True)
+        self.assertEqual(full_spec.argv_base, ("smartctl", "-a", "-j", "-d", "sat"))
+
+    def test_parse_int_from_strings(self) -> None:
+        self.assertEqual(hddtemp.parse_int("37"), 37)
+        self.assertEqual(hddtemp.parse_int("-5"), -5)
+        self.assertEqual(hddtemp.parse_int("41 Celsius"), 41)
+        self.assertIsNone(hddtemp.parse_int("n/a"))
+
+    def test_normalize_temp_c(self) -> None:
+        self.assertEqual(hddtemp.normalize_temp_c(37), 37)
+        self.assertEqual(hddtemp.normalize_temp_c(310), 37)
+        self.assertEqual(hddtemp.normalize_temp_c("310 K"), 37)
+        self.assertIsNone(hddtemp.normalize_temp_c(1000))
+        self.assertIsNone(hddtemp.normalize_temp_c(None))
+
+    def test_extract_model_skips_blank_candidates(self) -> None:
+        sample = {"model_name": "  ", "device": {"name": "/dev/sda", "model_name": "DiskA"}}
+        self.assertEqual(hddtemp.extract_model(sample, "/dev/sda"), "DiskA")
+        self.assertEqual(hddtemp.extract_model({"device": "bogus"}, "/dev/sdb"), "/dev/sdb")
 
     def test_extract_temperature_from_ata_table(self) -> None:
         sample = {
@@ -20,6 +51,35 @@ class HDDTempTests(unittest.TestCase):
         }
         self.assertEqual(hddtemp.extract_temperature_c(sample), 34)
 
+    def test_extract_temperature_tries_duplicate_attribute_rows(self) -> None:
+        sample = {
+            "ata_smart_attributes": {
+                "table": [
+                    {"id": 194, "raw": {"value": "n/a"}},
+                    {"id": 190, "raw": {"value": 40}},
+                    {"id": 194, "raw": {"value": 33}},
+                ]
+            }
+        }
+        self.assertEqual(hddtemp.extract_temperature_c(sample), 33)
+
+    def test_extract_temperature_prefers_attribute_194(self) -> None:
+        sample = {
+            "ata_smart_attributes": {
+                "table": [
+                    {"id": 190, "raw": {"value": 40}},
+                    {"id": 194, "raw": {"value": "not a number"}, "value": 36},
+                ]
+            }
+        }
+        self.assertEqual(hddtemp.extract_temperature_c(sample), 36)
+
+    def test_infer_status_from_messages_priority(self) -> None:
+        self.assertEqual(hddtemp.infer_status_from_messages("Permission denied\nDevice is in STANDBY mode", False), "SLP")
+        self.assertEqual(hddtemp.infer_status_from_messages("SMART support is: Unavailable", True), "NA")
+        self.assertEqual(hddtemp.infer_status_from_messages("", True), "KNOWN")
+        self.assertEqual(hddtemp.infer_status_from_messages("Temperature not reported", False), "NOS")
+
     def test_format_daemon_payload(self) -> None:
         readings = [
             hddtemp.DiskReading(
@@ -37,9 +97,219 @@ class HDDTempTests(unittest.TestCase):
         payload = hddtemp.format_daemon_payload(readings, "|", "C")
         self.assertEqual(payload, "|/dev/sda|DiskA|35|C||/dev/sdb|DiskB|SLP|*|")
 
+    def test_reading_cache_get_does_not_poll(self) -> None:
+        cache = hddtemp.ReadingCache([hddtemp.parse_device_spec("/dev/sda")], wake_up=False, min_interval=60)
+        reading = hddtemp.DiskReading(drive="/dev/sda", model="DiskA", status="KNOWN", temperature_c=35)
+        with mock.patch.object(hddtemp, "run_smartctl", return_value=reading) as run_smartctl:
+            self.assertEqual(cache.get(), ())
+            cache.refresh()
+            self.assertEqual(cache.get(), (reading,))
+            self.assertEqual(cache.get(), (reading,))
+        self.assertEqual(cache.payload("|", "C"), b"|/dev/sda|DiskA|35|C|")
+        self.assertEqual(cache.payload(":", "F"), b":/dev/sda:DiskA:95:F:")
+        self.assertIs(cache.payload("|", "C"), cache.payload("|", "C"))
+        self.assertEqual(run_smartctl.call_count, 1)
+
+    def test_reading_cache_refresh_next_polls_one_drive(self) -> None:
+        devices = [hddtemp.parse_device_spec("/dev/sda"), hddtemp.parse_device_spec("/dev/sdb")]
+        cache = hddtemp.ReadingCache(devices, wake_up=False, min_interval=60)
+        sleeping = [hddtemp.DiskReading(drive=device.drive, model="Disk", status="SLP") for device in devices]
+        awake = hddtemp.DiskReading(drive="/dev/sdb", model="Disk", status="KNOWN", temperature_c=40)
+        with mock.patch.object(hddtemp, "run_smartctl", side_effect=sleeping + [sleeping[0], awake]):
+            cache.refresh()
+            self.assertEqual(cache.payload("|", "C"), b"|/dev/sda|Disk|SLP|*||/dev/sdb|Disk|SLP|*|")
+            cache.refresh_next()
+            cache.refresh_next()
+        self.assertEqual(cache.get(), (sleeping[0], awake))
+        self.assertEqual(cache.payload("|", "C"), b"|/dev/sda|Disk|SLP|*||/dev/sdb|Disk|40|C|")
+
+    def test_reading_cache_marks_failed_poll_as_error(self) -> None:
+        cache = hddtemp.ReadingCache([hddtemp.parse_device_spec("/dev/sda")], wake_up=False, min_interval=60)
+        reading = hddtemp.DiskReading(drive="/dev/sda", model="DiskA", status="KNOWN", temperature_c=35)
+        with mock.patch.object(hddtemp, "run_smartctl", side_effect=[reading, PermissionError("denied"), reading]):
+            cache.refresh()
+            cache.refresh_next()
+            self.assertEqual(cache.payload("|", "C"), b"|/dev/sda|/dev/sda|ERR|*|")
+            self.assertEqual(cache.get()[0].detail, "smartctl failed: denied")
+            cache.refresh_next()
+        self.assertEqual(cache.get(), (reading,))
+
+    def test_refresh_loop_survives_errors(self) -> None:
+        cache = hddtemp.ReadingCache([hddtemp.parse_device_spec("/dev/sda")], wake_up=False, min_interval=60)
+        cache.min_interval = 0.01  # type: ignore[assignment]
+        server = hddtemp.HDDTempServer(("127.0.0.1", 0), cache=cache)
+        try:
+            calls = []
+
+            def refresh_next() -> None:
+                calls.append(None)
+                if len(calls) == 1:
+                    raise RuntimeError("boom")
+                server.stop_event.set()
+
+            with mock.patch.object(cache, "refresh_next", side_effect=refresh_next):
+                thread = threading.Thread(target=server.refresh_loop)
+                thread.start()
+                thread.join(timeout=5)
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(len(calls), 2)
+        finally:
+            server.server_close()
+
+    def test_refresh_loop_respects_min_interval_per_drive(self) -> None:
+        devices = [hddtemp.parse_device_spec(drive) for drive in ("/dev/a", "/dev/b", "/dev/c")]
+        cache = hddtemp.ReadingCache(devices, wake_up=False, min_interval=60)
+        cache.min_interval = 0.3  # type: ignore[assignment]
+        polls = {device.drive: [] for device in devices}
+
+        def run_smartctl(spec: hddtemp.DeviceSpec, wake_up: bool) -> hddtemp.DiskReading:
+            polls[spec.drive].append(time.monotonic())
+            return hddtemp.DiskReading(drive=spec.drive, model="Disk", status="SLP")
+
+        server = hddtemp.HDDTempServer(("127.0.0.1", 0), cache=cache)
+        try:
+            with mock.patch.object(hddtemp, "run_smartctl", side_effect=run_smartctl):
+                server.start_refresh()
+                time.sleep(1.0)
+                server.stop_event.set()
+                assert server.refresh_thread is not None
+                server.refresh_thread.join(timeout=5)
+        finally:
+            server.server_close()
+
+        for times in polls.values():
+            self.assertGreaterEqual(len(times), 2)
+            for earlier, later in zip(times, times[1:]):
+                self.assertGreaterEqual(later - earlier, 0.3 * 0.9)
+
+    def test_server_sends_cached_payload_and_closes(self) -> None:
+        cache = hddtemp.ReadingCache([], wake_up=False, min_interval=60)
+        # Larger than a socket buffer, so the write has to be resumed from the selector.
+        reading = hddtemp.DiskReading(drive="/dev/sda", model="DiskA", status="KNOWN", temperature_c=35)
+        cache.readings = (reading,) * 200000
+        server = hddtemp.HDDTempServer(("127.0.0.1", 0), cache=cache)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+        thread.start()
+        try:
+            chunks = []
+            with socket.create_connection(server.server_address, timeout=5) as client:
+                while True:
+                    chunk = client.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            self.assertEqual(b"".join(chunks), b"|/dev/sda|DiskA|35|C|" * 200000)
+        finally:
+            server.shutdown()
+            thread.join(timeout=5)
+            server.server_close()
+
+    def test_server_accept_survives_descriptor_exhaustion(self) -> None:
+        cache = hddtemp.ReadingCache([], wake_up=False, min_interval=60)
+        server = hddtemp.HDDTempServer(("127.0.0.1", 0), cache=cache)
+        try:
+            error = OSError(errno.EMFILE, "Too many open files")
+            with mock.patch.object(socket.socket, "accept", side_effect=error):
+                server.accept()
+            thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+            thread.start()
+            try:
+                with socket.create_connection(server.server_address, timeout=5) as client:
+                    self.assertEqual(client.recv(4096), b"")
+            finally:
+                server.shutdown()
+                thread.join(timeout=5)
+        finally:
+            server.server_close()
+
+    def test_reuse_port_requires_daemon_and_platform_support(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                hddtemp.main(["--reuse-port", "/dev/sda"])
+            with mock.patch.object(hddtemp, "socket", mock.Mock(spec=["AF_INET", "AF_INET6"])):
+                with self.assertRaises(SystemExit):
+                    hddtemp.main(["-d", "--reuse-port", "/dev/sda"])
+
     def test_convert_temperature_fahrenheit(self) -> None:
         self.assertEqual(hddtemp.convert_temperature(30, "F"), 86)
 
+    def test_convert_temperature_fahrenheit_rounding(self) -> None:
+        for temp_c in range(-80, 201):
+            self.assertEqual(hddtemp.convert_temperature(temp_c, "F"), int(round(temp_c * 9.0 / 5.0 + 32.0)))
+        self.assertEqual(hddtemp.convert_temperature(-20, "F"), -4)
+        self.assertEqual(hddtemp.convert_temperature(-18, "F"), 0)
+        self.assertEqual(hddtemp.convert_temperature(37, "F"), 99)
+
+
+
+STUB_SMARTCTL = """#!/bin/sh
+PATH=/usr/bin:/bin
+for arg in "$@"; do drive=$arg; done
+case "$drive" in
+  /dev/hung) exec sleep 30 ;;
+  /dev/bad)
+    echo "not json"
+    printf 'Ger\\303\\244t /dev/bad: open failed\\n' >&2
+    exit 2 ;;
+esac
+echo '{"model_name": "StubDisk", "temperature": {"current": 34}}'
+"""
+
+
+class RunSmartctlTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.bin_dir = tmpdir.name
+        for patcher in (
+            mock.patch.dict(os.environ, {"PATH": self.bin_dir}),
+            mock.patch.object(hddtemp, "_SMARTCTL_PATH", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def install_stub(self) -> None:
+        path = os.path.join(self.bin_dir, "smartctl")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(STUB_SMARTCTL)
+        os.chmod(path, 0o755)
+
+    def test_json_reading_is_known(self) -> None:
+        self.install_stub()
+        reading = hddtemp.run_smartctl(hddtemp.parse_device_spec("/dev/sda"), wake_up=False)
+        self.assertEqual(reading.status, "KNOWN")
+        self.assertEqual(reading.model, "StubDisk")
+        self.assertEqual(reading.temperature_c, 34)
+
+    def test_hung_smartctl_times_out_and_is_reaped(self) -> None:
+        self.install_stub()
+        procs = []
+        real_popen = subprocess.Popen
+
+        def popen(*args, **kwargs):  # type: ignore[no-untyped-def]
+            proc = real_popen(*args, **kwargs)
+            procs.append(proc)
+            return proc
+
+        started = time.monotonic()
+        with mock.patch.object(hddtemp.subprocess, "Popen", side_effect=popen):
+            reading = hddtemp.run_smartctl(hddtemp.parse_device_spec("/dev/hung"), wake_up=False, timeout=1)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(reading.status, "ERR")
+        self.assertEqual(reading.detail, "smartctl timed out")
+        self.assertEqual(len(procs), 1)
+        self.assertIsNotNone(procs[0].returncode)
+
+    def test_invalid_json_reports_decoded_stderr(self) -> None:
+        self.install_stub()
+        reading = hddtemp.run_smartctl(hddtemp.parse_device_spec("/dev/bad"), wake_up=False)
+        self.assertEqual(reading.status, "ERR")
+        self.assertEqual(reading.detail, "Ger\u00e4t /dev/bad: open failed")
+
+    def test_missing_smartctl(self) -> None:
+        reading = hddtemp.run_smartctl(hddtemp.parse_device_spec("/dev/sda"), wake_up=False)
+        self.assertEqual(reading.status, "ERR")
+        self.assertEqual(reading.detail, "smartctl not found (install smartmontools)")
 
 if __name__ == "__main__":
     unittest.main()